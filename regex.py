@@ -1,6 +1,14 @@
 import re
 import json
-from typing import List, Dict, Tuple
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, NamedTuple, Optional
+
+# orjson is optional: much faster JSON encoding if it's installed, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 """
 Data Extraction & Secure Validation Program
@@ -9,6 +17,103 @@ Security awareness: Rejects malformed/malicious input
 """
 
 
+# str.translate table that deletes every non-digit in Latin-1. The phone regex is
+# ASCII-only, so anything it matches is fully covered; validate_phone rejects whatever
+# is left over from other scripts
+_DROP_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not 48 <= c <= 57))
+
+
+# Luhn: what a digit turns into after being doubled (and its two digits summed)
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _luhn_ok(digits):
+    # Standard mod-10 checksum, walking from the rightmost (check) digit
+    total = 0
+    for i, c in enumerate(reversed(digits)):
+        d = ord(c) - 48
+        total += _LUHN_DOUBLED[d] if i & 1 else d
+    return total % 10 == 0
+
+
+def _strip_card(card):
+    # Two C-level replaces beat str.translate with a deletion table on strings this short
+    return card.replace(' ', '').replace('-', '')
+
+
+# Blocklists used by the validators (built once at import, not per call)
+BAD_EMAIL_TOKENS = ('union', 'select', 'drop', '--', '/*', '*/')
+BAD_URL_TOKENS = ('<script', 'onerror', 'onload')
+BAD_URL_SCHEMES = ('javascript:', 'data:', 'file:', 'about:')
+
+# Blocklists as one alternation each, so a single scan finds any bad token
+# instead of one substring search per keyword
+_EMAIL_BAD_RE = re.compile('|'.join(map(re.escape, BAD_EMAIL_TOKENS)))
+_URL_BAD_RE = re.compile('|'.join(map(re.escape, BAD_URL_TOKENS)))
+
+
+# Email/URL checks. They only depend on their string argument, and the same contact
+# addresses show up again and again in a report, so results are cached. The caches live
+# here rather than on DataExtractor methods, where every instance would become part of
+# the key and be kept alive by it. Phones and cards are deliberately not cached: they
+# rarely repeat, and a process-wide cache would keep card numbers in memory
+
+
+@functools.lru_cache(maxsize=4096)
+def _email_ok(email):
+    if not email or email[0] == '.' or email[-1] == '.' or '..' in email:
+        return False
+    # Exactly one '@': local part is everything before it, domain everything after
+    at = email.find('@')
+    if at < 0 or email.find('@', at + 1) >= 0:
+        return False
+    if at > 64 or len(email) - at - 1 > 255:
+        return False
+    if _EMAIL_BAD_RE.search(email.lower()):
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _url_ok(url):
+    lowered = url.lower()
+    if lowered.startswith(BAD_URL_SCHEMES):
+        return False
+    if _URL_BAD_RE.search(lowered):
+        return False
+    if '\x00' in url:
+        return False
+    return True
+
+
+def _clean_card_ok(clean):
+    # Card with separators already stripped. ASCII only: isdigit() also accepts
+    # other scripts' digits, which no card number uses
+    if not (clean.isascii() and clean.isdigit()):
+        return False
+    if not (13 <= len(clean) <= 19):
+        return False
+    if clean[0] * len(clean) == clean:
+        return False
+    return _luhn_ok(clean)
+
+
+class Match(NamedTuple):
+    # One extracted item. A tuple is much smaller than a dict per result and
+    # fields are plain attribute lookups. raw_format is only set for valid cards
+    type: str
+    value: str
+    status: str
+    raw_format: Optional[str] = None
+
+    def to_dict(self):
+        # Plain dict for JSON output (same shape as before, no raw_format unless set)
+        d = {'type': self.type, 'value': self.value, 'status': self.status}
+        if self.raw_format is not None:
+            d['raw_format'] = self.raw_format
+        return d
+
+
 class DataExtractor:
     # Just a class to grab stuff from text using regex. Not fancy, but it works!
     def __init__(self):
@@ -19,99 +124,115 @@ class DataExtractor:
         self.url_pattern = r"https?://[\w.-]+(?:/[\w./?%&=+-]*)?"
 
         # Phone regex: handles (123) 456-7890, 123-456-7890, 123.456.7890, +1-123-456-7890, etc.
-        self.phone_pattern = r"(?:\+\d{1,3}[-.\s]?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}(?:\s?(?:ext|x)\s?\d{2,5})?"
+        # Area code and extension are atomic (?>...) so the engine never re-tries them.
+        # The +country prefix stays backtrackable on purpose: +15551234567 needs it to give
+        # digits back to find the +1. (?<!\d) and the (?!\d) right after the last 4 digits
+        # stop a phone from being cut out of a longer digit run, like the first 10 digits
+        # of a card written without spaces. So 15551234567 (no + or separator) and
+        # 555-123-45678 are not phones. The extension isn't guarded: "ext 123456" still
+        # gives "ext 12345", as it always has
+        self.phone_pattern = r"(?<!\d)(?:\+\d{1,3}[-.\s]?)?(?>\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)(?>\s?(?:ext|x)\s?\d{2,5})?"
 
-        # Credit card regex: 13-19 digits, spaces or dashes allowed
-        self.credit_card_pattern = r"\b(?:\d[ -]?){13,19}\b"
+        # Credit card regex: 13-19 digits, single spaces or dashes allowed between them.
+        # Written as digit + (sep? digit) so there's only one way to match each char
+        # (no trailing separator for the engine to try with and without), and the
+        # separator is possessive (?+) since giving it back can never help
+        self.credit_card_pattern = r"\b\d(?:[ -]?+\d){12,18}\b"
+
+        # Compile everything once here so the extract/validate calls don't go
+        # through re's internal cache (or recompile) every time. Phones and cards
+        # are digit-only, so they use re.ASCII (cheaper class checks). Emails and
+        # URLs keep Unicode \w: with re.ASCII, jörg@example.de would come back as
+        # a "valid" rg@example.de
+        self._email_re = re.compile(self.email_pattern)
+        self._url_re = re.compile(self.url_pattern)
+        self._phone_re = re.compile(self.phone_pattern, re.ASCII)
+        self._cc_re = re.compile(self.credit_card_pattern, re.ASCII)
 
     def validate_email(self, email):
         # No double dots, no starting/ending with dot, no obvious SQL injection
-        if '..' in email or email.startswith('.') or email.endswith('.'):
-            return False
-        try:
-            local, domain = email.split('@')
-        except ValueError:
-            return False
-        if len(local) > 64 or len(domain) > 255:
-            return False
-        bad_stuff = ['union', 'select', 'drop', '--', '/*', '*/']
-        if any(bad in email.lower() for bad in bad_stuff):
-            return False
-        return True
+        return _email_ok(email)
 
     def validate_url(self, url):
         # Block javascript:, data:, file:, about: and XSS-y stuff
-        if url.lower().startswith(('javascript:', 'data:', 'file:', 'about:')):
-            return False
-        if any(bad in url.lower() for bad in ['<script', 'onerror', 'onload']):
-            return False
-        if '\x00' in url:
-            return False
-        return True
+        return _url_ok(url)
 
     def validate_phone(self, phone):
         # Only digits, must be 10-15 digits, not all the same digit
-        digits = re.sub(r'\D', '', phone)
+        digits = phone.translate(_DROP_NON_DIGITS)
+        if not (digits.isascii() and digits.isdigit()):
+            return False
         if not (10 <= len(digits) <= 15):
             return False
-        if len(set(digits)) == 1:
+        if digits[0] * len(digits) == digits:
             return False
         return True
 
     def validate_credit_card(self, card):
-        # Just check for digits, length, and not all the same digit
-        clean = card.replace(' ', '').replace('-', '')
-        if not clean.isdigit():
-            return False
-        if not (13 <= len(clean) <= 19):
-            return False
-        if len(set(clean)) == 1:
-            return False
-        return True
+        # Check digits, length, not all the same digit, and the Luhn checksum
+        return _clean_card_ok(_strip_card(card))
+
+    # iter_* yield results lazily as finditer finds them, for callers that stream
+    # over big inputs. extract_* are the same thing collected into a list
+
+    def iter_emails(self, text):
+        # Cheap literal check first: no '@' means no emails, skip the regex scan
+        if '@' not in text:
+            return iter(())
+        return self._check_emails(m.group() for m in self._email_re.finditer(text))
+
+    def iter_urls(self, text):
+        # Same idea: every URL we match has '://' in it
+        if '://' not in text:
+            return iter(())
+        return self._check_urls(m.group() for m in self._url_re.finditer(text))
+
+    def iter_phone_numbers(self, text):
+        return self._check_phones(m.group() for m in self._phone_re.finditer(text))
+
+    def iter_credit_cards(self, text):
+        return self._check_credit_cards(m.group() for m in self._cc_re.finditer(text))
 
     def extract_emails(self, text):
-        found = re.findall(self.email_pattern, text)
-        results = []
-        for email in found:
-            if self.validate_email(email):
-                results.append({'type': 'email', 'value': email, 'status': 'valid'})
-            else:
-                results.append({'type': 'email', 'value': email, 'status': 'invalid'})
-        return results
+        return list(self.iter_emails(text))
 
     def extract_urls(self, text):
-        found = re.findall(self.url_pattern, text)
-        results = []
-        for url in found:
-            if self.validate_url(url):
-                results.append({'type': 'url', 'value': url, 'status': 'valid'})
-            else:
-                results.append({'type': 'url', 'value': url, 'status': 'invalid'})
-        return results
+        return list(self.iter_urls(text))
 
     def extract_phone_numbers(self, text):
-        found = re.findall(self.phone_pattern, text)
-        results = []
-        for phone in found:
-            if self.validate_phone(phone):
-                results.append({'type': 'phone', 'value': phone.strip(), 'status': 'valid'})
-            else:
-                results.append({'type': 'phone', 'value': phone.strip(), 'status': 'invalid'})
-        return results
+        return list(self.iter_phone_numbers(text))
 
     def extract_credit_cards(self, text):
-        found = re.findall(self.credit_card_pattern, text)
-        results = []
+        return list(self.iter_credit_cards(text))
+
+    # The _check_* helpers turn raw regex hits into Match results (lazily). They run
+    # once per hit, so each binds its check to a local once per call. Emails and URLs
+    # call the module-level checks directly rather than going through validate_*
+
+    def _check_emails(self, found):
+        validate = _email_ok
+        return (Match('email', email, 'valid' if validate(email) else 'invalid') for email in found)
+
+    def _check_urls(self, found):
+        validate = _url_ok
+        return (Match('url', url, 'valid' if validate(url) else 'invalid') for url in found)
+
+    def _check_phones(self, found):
+        validate = self.validate_phone
+        return (Match('phone', phone.strip(), 'valid' if validate(phone) else 'invalid') for phone in found)
+
+    def _check_credit_cards(self, found):
         for card in found:
-            if self.validate_credit_card(card):
-                clean = card.replace(' ', '').replace('-', '')
+            clean = _strip_card(card)
+            if _clean_card_ok(clean):
                 masked = '*' * (len(clean) - 4) + clean[-4:]
-                results.append({'type': 'credit_card', 'value': masked, 'status': 'valid', 'raw_format': card})
+                yield Match('credit_card', masked, 'valid', card)
             else:
-                results.append({'type': 'credit_card', 'value': card, 'status': 'invalid'})
-        return results
+                yield Match('credit_card', card, 'invalid')
 
     def extract_all(self, text):
+        # One scan per type, each going through its own cheap literal check first
+        # (no '@' -> no email scan, no '://' -> no URL scan)
         return {
             'emails': self.extract_emails(text),
             'urls': self.extract_urls(text),
@@ -119,6 +240,20 @@ class DataExtractor:
             'credit_cards': self.extract_credit_cards(text)
         }
 
+    def extract_many(self, texts, workers=None):
+        # extract_all over a batch of documents. Regex scanning holds the GIL, so the
+        # batch is spread over worker processes (one per core by default) instead of
+        # threads. Results come back in the same order as texts. workers=1 skips the pool.
+        # Every call starts (and tears down) its own pool, so pass a whole batch at once
+        # rather than calling this in a loop
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        texts = list(texts)
+        if workers == 1 or len(texts) < 2:
+            return [self.extract_all(text) for text in texts]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.extract_all, texts, chunksize=8))
+
 
 # SAMPLE INPUT - Realistic data with variations and edge cases
 SAMPLE_INPUT = """
@@ -146,12 +281,12 @@ Phone Directory:
 - Invalid: 123-456, 111-111-1111 (repeated digits)
 
 Payment Information (MASKED FOR SECURITY):
-- Visa: 4532 1234 5678 9010
-- Mastercard: 5412 1234 5678 9012
+- Visa: 4532 0151 1283 0366
+- Mastercard: 5425 2334 3010 9903
 - American Express: 3782 822463 10005
-- Invalid: 1234 5678 (too short), 9999-9999-9999-9999 (repeated)
-- Spaces variant: 5412 1234 5678 9012
-- Dash variant: 5412-1234-5678-9012
+- Invalid: 1234 5678 (too short), 9999-9999-9999-9999 (repeated), 4532 0151 1283 0367 (bad checksum)
+- Spaces variant: 5425 2334 3010 9903
+- Dash variant: 5425-2334-3010-9903
 
 MALICIOUS/EDGE CASES:
 - Email: a.nyang@alustudent.com; DROP TABLE users;--
@@ -164,6 +299,23 @@ END OF REPORT
 """
 
 
+def _to_json(data):
+    # Pretty-printed JSON with a 2-space layout. orjson always writes non-ASCII
+    # (e.g. jörg@example.de) as-is, so the stdlib path uses ensure_ascii=False to
+    # give the same output whichever encoder is installed
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _partition(items):
+    # Split results into (valid, invalid) in one pass
+    valid, invalid = [], []
+    for item in items:
+        (valid if item.status == 'valid' else invalid).append(item)
+    return valid, invalid
+
+
 def main():
     """Main execution - extract and display results"""
     
@@ -185,63 +337,59 @@ def main():
     
     # Emails
     print("EMAILS FOUND:")
-    valid_emails = [item for item in results['emails'] if item['status'] == 'valid']
+    valid_emails, invalid_emails = _partition(results['emails'])
     print(f"  Valid: {len(valid_emails)}")
     for item in valid_emails:
-        print(f"    + {item['value']}")
+        print(f"    + {item.value}")
     
-    invalid_emails = [item for item in results['emails'] if item['status'] != 'valid']
     if invalid_emails:
         print(f"  Invalid/Rejected: {len(invalid_emails)}")
         for item in invalid_emails:
-            print(f"    - {item['value']} - {item['status']}")
+            print(f"    - {item.value} - {item.status}")
     print()
     
     # URLs
     print("URLS FOUND:")
-    valid_urls = [item for item in results['urls'] if item['status'] == 'valid']
+    valid_urls, invalid_urls = _partition(results['urls'])
     print(f"  Valid: {len(valid_urls)}")
     for item in valid_urls:
-        print(f"    + {item['value']}")
+        print(f"    + {item.value}")
     
-    invalid_urls = [item for item in results['urls'] if item['status'] != 'valid']
     if invalid_urls:
         print(f"  Invalid/Rejected: {len(invalid_urls)}")
         for item in invalid_urls:
-            print(f"    - {item['value']} - {item['status']}")
+            print(f"    - {item.value} - {item.status}")
     print()
     
     # Phone Numbers
     print("PHONE NUMBERS FOUND:")
-    valid_phones = [item for item in results['phones'] if item['status'] == 'valid']
+    valid_phones, invalid_phones = _partition(results['phones'])
     print(f"  Valid: {len(valid_phones)}")
     for item in valid_phones:
-        print(f"    + {item['value']}")
+        print(f"    + {item.value}")
     
-    invalid_phones = [item for item in results['phones'] if item['status'] != 'valid']
     if invalid_phones:
         print(f"  Invalid/Rejected: {len(invalid_phones)}")
         for item in invalid_phones:
-            print(f"    - {item['value']} - {item['status']}")
+            print(f"    - {item.value} - {item.status}")
     print()
     
     # Credit Cards (MASKED)
     print("CREDIT CARDS FOUND (MASKED FOR SECURITY):")
-    valid_cards = [item for item in results['credit_cards'] if item['status'] == 'valid']
+    valid_cards, invalid_cards = _partition(results['credit_cards'])
     print(f"  Valid: {len(valid_cards)}")
     for item in valid_cards:
-        print(f"    + {item['value']} (format: {item['raw_format']})")
+        print(f"    + {item.value} (format: {item.raw_format})")
     
-    invalid_cards = [item for item in results['credit_cards'] if item['status'] != 'valid']
     if invalid_cards:
         print(f"  Invalid/Rejected: {len(invalid_cards)}")
         for item in invalid_cards:
-            print(f"    - {item['value']} - {item['status']}")
+            print(f"    - {item.value} - {item.status}")
     print()
     
     # JSON Export
     print("\nJSON OUTPUT:")
-    print(json.dumps(results, indent=2))
+    print(_to_json({kind: [item.to_dict() for item in items] for kind, items in results.items()}))
 
 
 if __name__ == "__main__":